@@ -10,6 +10,8 @@ from pygame.locals import (
     QUIT, KEYDOWN, K_q, K_l, K_ESCAPE, K_F11, K_f, K_SPACE, K_UP, K_r, MOUSEBUTTONDOWN, VIDEORESIZE
 )
 
+from render_governor import RenderGovernor
+
 # === CONFIG ===
 BASE_WIDTH = 400
 BASE_HEIGHT = 600
@@ -25,6 +27,18 @@ PIPE_GAP = 150
 PIPE_SPACING = 300
 
 MAX_LEADERBOARD_ENTRIES = 10
+
+# Render governor: frame budget and quality ladder, best quality first.
+# Each level is (name, scale function, fraction of the screen drawn to);
+# levels below 1.0 letterbox the frame to scale fewer pixels.
+FRAME_BUDGET_MS = 1000 / FPS
+RENDER_LEVELS = [
+    ("smooth", pygame.transform.smoothscale, 1.0),
+    ("fast", pygame.transform.scale, 1.0),
+    ("reduced", pygame.transform.scale, 0.85),
+    ("low", pygame.transform.scale, 0.7),
+]
+
 def get_data_dir(app_name="FlappyBird"):
     system = platform.system()
     if system == "Windows":
@@ -121,6 +135,8 @@ pygame.display.set_caption("Flappy Bird by Tanmay")
 clock = pygame.time.Clock()
 
 leaderboard = Leaderboard(MAX_LEADERBOARD_ENTRIES)
+render_governor = RenderGovernor(RENDER_LEVELS, FRAME_BUDGET_MS)
+presented_level = render_governor.level
 
 
 # === ASSETS ===
@@ -354,6 +370,35 @@ def toggle_fullscreen():
         current_height = BASE_HEIGHT
         screen = pygame.display.set_mode((current_width, current_height), pygame.RESIZABLE)
     pygame.display.set_caption("Flappy Bird by Tanmay")
+    render_governor.reset()
+
+
+def present_frame(game_surface, viewport_width):
+    """Scale the game surface to the screen at the governor's quality and flip."""
+    global presented_level
+    # Clear leftovers of a larger frame when the quality level changes
+    if render_governor.level != presented_level:
+        screen.fill((0, 0, 0))
+        presented_level = render_governor.level
+
+    if current_height == BASE_HEIGHT:
+        screen.blit(game_surface, (0, 0))
+        pygame.display.flip()
+        return
+
+    # Only scale the part of the surface that reaches the screen, keeping
+    # proportion; a lower output scale draws the same view smaller and centred.
+    output_scale = render_governor.output_scale
+    visible_width = min(viewport_width, math.ceil(current_width * BASE_HEIGHT / current_height))
+    target_width = int(visible_width * current_height / BASE_HEIGHT * output_scale)
+    target_height = int(current_height * output_scale)
+    visible = game_surface.subsurface((0, 0, visible_width, BASE_HEIGHT))
+    scaled = render_governor.scale_func(visible, (target_width, target_height))
+
+    offset_x = (current_width - target_width) // 2
+    offset_y = (current_height - target_height) // 2
+    screen.blit(scaled, (offset_x, offset_y))
+    pygame.display.flip()
 
 
 def render_leaderboard(surface, viewport_width, current_score=None, rank=None):
@@ -451,6 +496,13 @@ final_rank = None
 
 while running:
     clock.tick(FPS)
+    # Raw time excludes the FPS cap delay, so it measures the real frame cost.
+    # Quality only matters while the frame is being scaled (fullscreen).
+    if current_height != BASE_HEIGHT:
+        render_governor.record(clock.get_rawtime(), pygame.time.get_ticks())
+    for switch in render_governor.pop_events():
+        print(f"Render quality: {switch['from']} -> {switch['to']} "
+              f"(median {switch['cost_ms']:.1f} ms)")
     for event in pygame.event.get():
         if event.type == QUIT:
             running = False
@@ -547,13 +599,7 @@ while running:
                                   (0, 0, 0, 200), viewport_width, 10)
         
         # Scale to screen
-        if current_height != BASE_HEIGHT:
-            scale_factor = current_height / BASE_HEIGHT
-            scaled_width = int(viewport_width * scale_factor)
-            game_surface = pygame.transform.scale(game_surface, (scaled_width, current_height))
-        
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
+        present_frame(game_surface, viewport_width)
         continue
 
     if state == "PLAYING":
@@ -599,13 +645,7 @@ while running:
         display_score(game_surface, score, viewport_width)
         
         # Scale to screen
-        if current_height != BASE_HEIGHT:
-            scale_factor = current_height / BASE_HEIGHT
-            scaled_width = int(viewport_width * scale_factor)
-            game_surface = pygame.transform.scale(game_surface, (scaled_width, current_height))
-        
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
+        present_frame(game_surface, viewport_width)
 
         # Collisions and top death
         hit_ground = pygame.sprite.spritecollide(bird, ground_group, False, pygame.sprite.collide_mask)
@@ -660,12 +700,6 @@ while running:
                               (0, 0, 0, 180), viewport_width, 8)
         
         # Scale to screen
-        if current_height != BASE_HEIGHT:
-            scale_factor = current_height / BASE_HEIGHT
-            scaled_width = int(viewport_width * scale_factor)
-            game_surface = pygame.transform.scale(game_surface, (scaled_width, current_height))
-        
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
+        present_frame(game_surface, viewport_width)
 
 pygame.quit()
\ No newline at end of file
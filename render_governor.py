@@ -0,0 +1,114 @@
+"""Frame-time governor that trades render quality for a steady frame rate.
+
+Kept free of pygame so the switching logic can be checked without a display.
+"""
+from collections import deque
+from statistics import median
+
+GOVERNOR_WINDOW = 30         # frames looked at before deciding
+GOVERNOR_SKIP_FRAMES = 2     # samples ignored after start-up or a mode change
+GOVERNOR_DOWNGRADE = 0.9     # a frame above this fraction of the budget is a miss
+GOVERNOR_MISS_FRACTION = 0.25  # drop quality when this share of the window missed
+GOVERNOR_UPGRADE = 0.5       # raise quality when the median is below this fraction
+GOVERNOR_FIT = 0.75          # predicted cost of the better level must stay below this
+GOVERNOR_RETRY_FRAMES = 120  # wait before retrying a level that was dropped
+GOVERNOR_RETRY_MAX = 3600    # longest wait after repeated failures
+
+
+class RenderGovernor:
+    """Pick a level from a quality ladder based on recent frame times.
+
+    ``levels`` is a list of ``(name, scale_func, output_scale)`` tuples, best
+    quality first. Frame times are recorded with :meth:`record`; switches are
+    kept in :attr:`events` until read with :meth:`pop_events`.
+    """
+
+    def __init__(self, levels, budget_ms, window=GOVERNOR_WINDOW):
+        self.levels = levels
+        self.budget_ms = budget_ms
+        self.frame_times = deque(maxlen=window)
+        self.events = deque(maxlen=50)
+        self.level = 0
+        # The first tick includes asset loading, so it is never a fair sample
+        self.skip_frames = GOVERNOR_SKIP_FRAMES
+        self.cooldown = 0
+        self.failed_cost = {}   # level -> median cost when it was dropped
+        self.cost_ratio = {}    # level -> its cost relative to the level below
+        self.retry_wait = {}    # level -> frames to wait before the next retry
+
+    @property
+    def name(self):
+        return self.levels[self.level][0]
+
+    @property
+    def scale_func(self):
+        return self.levels[self.level][1]
+
+    @property
+    def output_scale(self):
+        return self.levels[self.level][2]
+
+    def reset(self):
+        """Forget recent frame times, e.g. after the display mode changes.
+
+        The level, cooldown and learned costs are kept, so re-entering
+        fullscreen does not restart at the most expensive level.
+        """
+        self.frame_times.clear()
+        self.skip_frames = GOVERNOR_SKIP_FRAMES
+
+    def record(self, frame_ms, now):
+        """Record a frame's work time and adjust the level if needed."""
+        if self.skip_frames > 0:
+            self.skip_frames -= 1
+            return
+        if self.cooldown > 0:
+            self.cooldown -= 1
+
+        self.frame_times.append(frame_ms)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return
+
+        # The median ignores single hitches such as a leaderboard save
+        cost = median(self.frame_times)
+        above = self.level - 1
+        if above in self.failed_cost and above not in self.cost_ratio:
+            self.cost_ratio[above] = self.failed_cost[above] / max(cost, 1)
+
+        misses = sum(1 for t in self.frame_times if t > self.budget_ms * GOVERNOR_DOWNGRADE)
+        if (misses >= len(self.frame_times) * GOVERNOR_MISS_FRACTION
+                and self.level < len(self.levels) - 1):
+            self.failed_cost[self.level] = cost
+            self.cost_ratio.pop(self.level, None)
+            # Each failure of the same level doubles the wait before retrying it
+            self.cooldown = self.retry_wait.get(self.level, GOVERNOR_RETRY_FRAMES)
+            self.retry_wait[self.level] = min(self.cooldown * 2, GOVERNOR_RETRY_MAX)
+            self._switch(self.level + 1, cost, now)
+        elif (self.level > 0 and self.cooldown == 0
+                and cost < self.budget_ms * GOVERNOR_UPGRADE
+                and self._fits(above, cost)):
+            self._switch(above, cost, now)
+
+    def pop_events(self):
+        """Return and clear the switch events recorded since the last call."""
+        events = list(self.events)
+        self.events.clear()
+        return events
+
+    def _fits(self, level, cost):
+        """Whether ``level`` would fit the budget, judged by its last failure."""
+        ratio = self.cost_ratio.get(level)
+        if ratio is None:
+            return True
+        return cost * ratio < self.budget_ms * GOVERNOR_FIT
+
+    def _switch(self, level, cost, now):
+        old_name = self.name
+        self.level = level
+        self.frame_times.clear()
+        self.events.append({
+            'time': now,
+            'from': old_name,
+            'to': self.name,
+            'cost_ms': cost,
+        })
@@ -0,0 +1,66 @@
+from render_governor import RenderGovernor, GOVERNOR_SKIP_FRAMES
+
+BUDGET = 1000 / 60
+WINDOW = 30
+LEVELS = [
+    ("smooth", None, 1.0),
+    ("fast", None, 1.0),
+    ("reduced", None, 0.85),
+    ("low", None, 0.7),
+]
+
+
+def make_governor():
+    governor = RenderGovernor(LEVELS, BUDGET, window=WINDOW)
+    governor.skip_frames = 0
+    return governor
+
+
+def feed(governor, frames, cost_by_level):
+    """Record ``frames`` samples whose cost depends on the current level."""
+    for frame in range(frames):
+        governor.record(cost_by_level[governor.name], frame)
+
+
+def test_downgrades_when_budget_missed():
+    governor = make_governor()
+    feed(governor, WINDOW, {"smooth": 25})
+    assert governor.name == "fast"
+    event, = governor.pop_events()
+    assert (event["from"], event["to"]) == ("smooth", "fast")
+
+
+def test_upgrades_when_there_is_headroom():
+    governor = make_governor()
+    feed(governor, WINDOW * 2, {"smooth": 25, "fast": 15})
+    assert governor.name == "fast"
+    feed(governor, 1000, {"smooth": 8, "fast": 5})
+    assert governor.name == "smooth"
+
+
+def test_does_not_oscillate_between_levels():
+    governor = make_governor()
+    feed(governor, 3000, {"smooth": 16, "fast": 7})
+    switches = [(e["from"], e["to"]) for e in governor.pop_events()]
+    assert switches == [("smooth", "fast")]
+    assert governor.name == "fast"
+
+
+def test_single_spike_does_not_downgrade():
+    governor = make_governor()
+    governor.record(400, 0)
+    for frame in range(1, WINDOW * 3):
+        governor.record(5, frame)
+    assert governor.name == "smooth"
+    assert governor.pop_events() == []
+
+
+def test_reset_skips_mode_switch_frames():
+    governor = make_governor()
+    feed(governor, WINDOW, {"smooth": 25})
+    governor.reset()
+    assert governor.name == "fast"
+    assert governor.cooldown > 0
+    for frame in range(GOVERNOR_SKIP_FRAMES):
+        governor.record(400, frame)
+    assert list(governor.frame_times) == []